@@ -0,0 +1,113 @@
+"""
+Tests for utils/generate-pdf-weasyprint.py
+
+The quick commands (--help, validate, html, --html-only) must not import
+WeasyPrint and must start fast enough to be called from scripts in tight
+loops. Bad input must be reported as an error, not a traceback.
+
+Run with:
+    python -m pytest -q tests
+"""
+
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).resolve().parent.parent / 'utils' / 'generate-pdf-weasyprint.py'
+
+# Cumulative import time of all top-level imports, in microseconds
+IMPORT_BUDGET_US = 90_000
+
+IMPORTTIME_LINE = re.compile(r'^import time:\s+\d+ \|\s+(\d+) \|( *)(\S+)')
+
+RESUME_YAML = """\
+personal_info:
+  _type: contact
+  name: Jane Doe
+summary: Example summary
+"""
+
+
+def run_script(args, cwd):
+    """Run the script, returning the completed process"""
+    return subprocess.run([sys.executable, str(SCRIPT), *args],
+                          cwd=cwd, capture_output=True, text=True)
+
+
+def run_importtime(args, cwd):
+    """Run the script under -X importtime, returning {top-level module: us}"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', str(SCRIPT), *args],
+        cwd=cwd, capture_output=True, text=True)
+    assert result.returncode == 0, result.stdout + result.stderr
+
+    imports = {}
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        # Nested imports are indented; their time is already in the parent
+        if match and len(match.group(2)) == 1:
+            imports[match.group(3)] = int(match.group(1))
+    assert imports, "no -X importtime output captured"
+    return imports, result.stderr
+
+
+@pytest.mark.parametrize('args, output_file', [
+    (['--help'], None),
+    (['validate'], None),
+    (['html', '-o', 'out.html'], 'out.html'),
+    (['--html-only'], 'resume.html'),
+])
+def test_quick_commands_stay_within_import_budget(args, output_file, tmp_path):
+    (tmp_path / 'resume.yml').write_text(RESUME_YAML, encoding='utf-8')
+
+    imports, output = run_importtime(args, tmp_path)
+
+    if output_file:
+        html = (tmp_path / output_file).read_text(encoding='utf-8')
+        assert 'Jane Doe' in html
+
+    assert 'weasyprint' not in output
+    total = sum(imports.values())
+    slowest = sorted(imports.items(), key=lambda item: -item[1])[:5]
+    assert total < IMPORT_BUDGET_US, (
+        f"imports took {total / 1000:.1f} ms "
+        f"(budget {IMPORT_BUDGET_US / 1000:.0f} ms); slowest: {slowest}")
+
+
+@pytest.mark.parametrize('content, message', [
+    ('a: [\n', 'Error: resume.yml: while parsing'),
+    ('', 'Error: resume.yml: top level of the YAML file must be a mapping'),
+    ('- a\n- b\n', 'Error: resume.yml: top level of the YAML file must be a mapping'),
+])
+@pytest.mark.parametrize('command', ['validate', 'html'])
+def test_malformed_resume_is_reported(command, content, message, tmp_path):
+    (tmp_path / 'resume.yml').write_text(content, encoding='utf-8')
+
+    result = run_script([command], tmp_path)
+
+    assert result.returncode == 1
+    assert message in result.stdout
+    assert 'Traceback' not in result.stderr
+
+
+def test_validate_reports_schema_errors(tmp_path):
+    (tmp_path / 'resume.yml').write_text(
+        RESUME_YAML + 'education: [BSc]\n', encoding='utf-8')
+
+    result = run_script(['validate'], tmp_path)
+
+    assert result.returncode == 1
+    assert "Error: 'education' must be a mapping" in result.stdout
+
+
+def test_validate_rejects_flexible_layout(tmp_path):
+    template = SCRIPT.parent.parent / 'examples' / 'resume-template.yml'
+
+    result = run_script(['validate', '-i', str(template)], tmp_path)
+
+    assert result.returncode == 1
+    assert "Error: missing 'personal_info' section" in result.stdout
+    assert 'section_contact' in result.stdout
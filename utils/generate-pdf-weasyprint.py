@@ -4,26 +4,33 @@ Generate PDF from HTML resume using WeasyPrint
 This is a backup option if browser Print-to-PDF doesn't work well.
 
 Usage:
-    python generate-pdf-weasyprint.py
+    python generate-pdf-weasyprint.py                 # resume.yml -> resume.pdf
+    python generate-pdf-weasyprint.py pdf -o out.pdf
+    python generate-pdf-weasyprint.py pdf --html-only # resume.yml -> resume.html
+    python generate-pdf-weasyprint.py html -o out.html
+    python generate-pdf-weasyprint.py validate
+
+WeasyPrint (and PyYAML) are imported only when a command needs them, so
+`html`, `validate` and `--help` start quickly and work without WeasyPrint's
+system dependencies.
 
 Requirements:
     pip install weasyprint pyyaml
 """
 
-import yaml
+import argparse
 import sys
 from pathlib import Path
 
-try:
-    from weasyprint import HTML, CSS
-except ImportError:
-    print("Error: WeasyPrint not installed")
-    print("Install with: pip install -r requirements.txt")
-    sys.exit(1)
+COMMANDS = ('pdf', 'html', 'validate')
+SECTION_KEYS = ('education', 'skills', 'work_experience',
+                'research_experience', 'certificates', 'publications')
 
 
 def load_yaml(yaml_path):
     """Load and parse YAML file"""
+    import yaml
+
     with open(yaml_path, 'r', encoding='utf-8') as f:
         return yaml.safe_load(f)
 
@@ -288,27 +295,27 @@ def generate_html(data):
     
     # Education
     if data.get('education'):
-        html_sections.append(render_education(data['education']))
+        html_sections.append(render_education(data['education'], 'education'))
     
     # Skills
     if data.get('skills'):
-        html_sections.append(render_skills(data['skills']))
+        html_sections.append(render_skills(data['skills'], 'skills'))
     
     # Work Experience
     if data.get('work_experience'):
-        html_sections.append(render_work_experience(data['work_experience']))
+        html_sections.append(render_work_experience(data['work_experience'], 'work_experience'))
     
     # Research Experience
     if data.get('research_experience'):
-        html_sections.append(render_research_experience(data['research_experience']))
+        html_sections.append(render_research_experience(data['research_experience'], 'research_experience'))
     
     # Certificates
     if data.get('certificates'):
-        html_sections.append(render_certificates(data['certificates']))
+        html_sections.append(render_certificates(data['certificates'], 'certificates'))
     
     # Publications
     if data.get('publications'):
-        html_sections.append(render_publications(data['publications']))
+        html_sections.append(render_publications(data['publications'], 'publications'))
     
     # Complete HTML document
     html = f"""
@@ -349,23 +356,50 @@ def generate_html(data):
     return html
 
 
-def main():
-    """Main function to generate PDF"""
-    yaml_path = Path('resume.yml')
-    output_path = Path('resume.pdf')
-    
-    # Check if YAML file exists
+def load_resume(yaml_path):
+    """Load resume data, exiting with a message if it is missing or malformed"""
+    import yaml
+
     if not yaml_path.exists():
         print(f"Error: {yaml_path} not found")
-        print("Make sure resume.yml is in the current directory")
+        print("Pass the resume file with -i/--input")
         sys.exit(1)
-    
+
     print("Loading resume data...")
-    data = load_yaml(yaml_path)
-    
+    try:
+        data = load_yaml(yaml_path)
+    except yaml.YAMLError as e:
+        print(f"Error: {yaml_path}: {e}")
+        sys.exit(1)
+
+    if not isinstance(data, dict):
+        print(f"Error: {yaml_path}: top level of the YAML file must be a mapping")
+        sys.exit(1)
+    return data
+
+
+def render_html(data):
+    """Generate the HTML document for the given resume data"""
     print("Generating HTML...")
-    html_content = generate_html(data)
-    
+    return generate_html(data)
+
+
+def write_html(html_content, output_path):
+    """Write the generated HTML document to output_path"""
+    output_path.write_text(html_content, encoding='utf-8')
+    print(f"✓ HTML generated successfully: {output_path}")
+
+
+def write_pdf(html_content, output_path):
+    """Render the generated HTML document to a PDF with WeasyPrint"""
+    try:
+        from weasyprint import HTML
+    except ImportError:
+        print("Error: WeasyPrint not installed")
+        print("Install with: pip install -r requirements.txt")
+        print("Or use --html-only to skip PDF generation")
+        sys.exit(1)
+
     print("Generating PDF...")
     try:
         HTML(string=html_content).write_pdf(output_path)
@@ -381,5 +415,99 @@ def main():
         sys.exit(1)
 
 
+def validate(data):
+    """Check data against the fixed-key schema generate_html renders,
+    returning a list of problems"""
+    errors = []
+    if not isinstance(data.get('personal_info'), dict):
+        errors.append("missing 'personal_info' section")
+
+    # Flexible `section_*` + `_type` layouts (docs/FLEXIBLE-SYSTEM.md) are
+    # rendered by the browser version only; this script would drop them
+    unsupported = [key for key, section in data.items()
+                   if key not in ('personal_info', 'summary') + SECTION_KEYS
+                   and isinstance(section, dict) and '_type' in section]
+    if unsupported:
+        errors.append("sections with custom keys are not supported by this "
+                      f"script: {', '.join(unsupported)}")
+
+    for key in SECTION_KEYS:
+        section = data.get(key)
+        if section is not None and not isinstance(section, dict):
+            errors.append(f"'{key}' must be a mapping")
+        elif isinstance(section, dict) and 'items' in section \
+                and not isinstance(section['items'], list):
+            errors.append(f"'{key}.items' must be a list")
+    return errors
+
+
+def cmd_pdf(args):
+    """Generate the PDF (or only its HTML with --html-only)"""
+    html_content = render_html(load_resume(args.input))
+    if args.html_only:
+        write_html(html_content, args.output or Path('resume.html'))
+    else:
+        write_pdf(html_content, args.output or Path('resume.pdf'))
+
+
+def cmd_html(args):
+    """Generate the standalone HTML document"""
+    html_content = render_html(load_resume(args.input))
+    write_html(html_content, args.output or Path('resume.html'))
+
+
+def cmd_validate(args):
+    """Validate the resume YAML without rendering anything"""
+    data = load_resume(args.input)
+    errors = validate(data)
+    if errors:
+        for error in errors:
+            print(f"Error: {error}")
+        sys.exit(1)
+    print(f"✓ {args.input} is valid")
+
+
+def build_parser():
+    """Build the command-line parser"""
+    parser = argparse.ArgumentParser(
+        description="Generate a resume PDF (or HTML) from resume.yml. "
+                    "Defaults to the 'pdf' command when none is given.")
+    subparsers = parser.add_subparsers(dest='command')
+
+    pdf = subparsers.add_parser('pdf', help="generate resume.pdf with WeasyPrint")
+    pdf.add_argument('--html-only', action='store_true',
+                     help="write the intermediate HTML instead of a PDF "
+                          "(does not import WeasyPrint)")
+    pdf.set_defaults(func=cmd_pdf)
+
+    html = subparsers.add_parser('html', help="generate resume.html only")
+    html.set_defaults(func=cmd_html)
+
+    check = subparsers.add_parser(
+        'validate',
+        help="check resume.yml against the fixed-key schema this script renders")
+    check.set_defaults(func=cmd_validate)
+
+    for sub in (pdf, html, check):
+        sub.add_argument('-i', '--input', type=Path, default=Path('resume.yml'),
+                         help="resume YAML file (default: resume.yml)")
+    for sub in (pdf, html):
+        sub.add_argument('-o', '--output', type=Path, default=None,
+                         help="output file (default: resume.pdf or resume.html)")
+
+    return parser
+
+
+def main(argv=None):
+    """Main function: dispatch to the requested command"""
+    argv = sys.argv[1:] if argv is None else list(argv)
+    # Keep `generate-pdf-weasyprint.py [--html-only]` working without a command
+    if not argv or (argv[0] not in COMMANDS and argv[0] not in ('-h', '--help')):
+        argv = ['pdf'] + argv
+
+    args = build_parser().parse_args(argv)
+    args.func(args)
+
+
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()